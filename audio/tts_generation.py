@@ -7,12 +7,362 @@ Uses Google Cloud Text-to-Speech
 import os
 import sys
 import json
-from typing import Dict, Any
+import hashlib
+import shutil
+import tempfile
+import functools
+import threading
+import time
+import queue
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, List, Optional
 from google.cloud import texttospeech
 
+# Shared client so credential discovery and the gRPC channel setup are
+# paid once per process, not once per call
+_CLIENT: Optional[texttospeech.TextToSpeechClient] = None
+_CLIENT_LOCK = threading.Lock()
 
+# Channel options tuned for long-lived, low-QPS TTS traffic: keepalive pings
+# stop the channel from going idle between bursts (worker mode can sit quiet
+# for minutes), so later calls don't stall on a TCP+TLS+HTTP/2 re-handshake
+_GRPC_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.keepalive_timeout_ms", 10000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.max_receive_message_length", 32 << 20),
+]
 
-def generate_audio(text: str, output_path: str, voice: str = None, speed: float = 1.0) -> Dict[str, Any]:
+
+def _make_client() -> texttospeech.TextToSpeechClient:
+    """Build a TTS client over a gRPC channel with explicit keepalive options."""
+    try:
+        transport_cls = texttospeech.TextToSpeechClient.get_transport_class("grpc")
+        channel = transport_cls.create_channel(
+            "texttospeech.googleapis.com:443",
+            options=_GRPC_CHANNEL_OPTIONS
+        )
+        return texttospeech.TextToSpeechClient(transport=transport_cls(channel=channel))
+    except Exception as e:
+        # Never fail synthesis over channel tuning; fall back to defaults
+        print(f"⚠️  Falling back to default TTS channel options: {e}", file=sys.stderr)
+        return texttospeech.TextToSpeechClient()
+
+
+def _get_client() -> texttospeech.TextToSpeechClient:
+    """Return the process-wide TTS client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = _make_client()
+    return _CLIENT
+
+# Google TTS rejects inputs over 5000 bytes; stay comfortably under it
+MAX_CHUNK_BYTES = 4500
+
+# Supported output encodings: (Google encoding name, file suffix, MIME type).
+# Opus is ~4x smaller than MP3 at equivalent speech quality, cutting both the
+# TTS download and the HeyGen upload.
+AUDIO_FORMATS = {
+    "mp3": ("MP3", ".mp3", "audio/mpeg"),
+    "opus": ("OGG_OPUS", ".ogg", "audio/ogg"),
+    "linear16": ("LINEAR16", ".wav", "audio/wav")
+}
+
+# On-disk cache for synthesized audio, keyed by a hash of all synthesis
+# parameters (text alone is not enough - voice/speed/encoding changes must miss)
+CACHE_DIR = os.environ.get("TTS_CACHE_DIR", os.path.expanduser("~/.cache/tts"))
+CACHE_MAX_BYTES = int(os.environ.get("TTS_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+def _cache_key(text: str, voice: str, speed: float, audio_format: str = "mp3") -> str:
+    """Deterministic cache key covering every parameter that affects output."""
+    params = {
+        "text": text,
+        "voice": voice,
+        "speed": speed,
+        "encoding": AUDIO_FORMATS[audio_format][0],
+        "lang": "en-US"
+    }
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def _cache_store(cache_path: str, audio_content: bytes):
+    """Atomically write synthesized audio into the cache directory."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(audio_content)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    _evict_cache()
+
+
+# Optional semantic cache layer: exact-hash caches miss trivial variations
+# ("Hello!" vs "Hello.") that listeners can't tell apart. Requires
+# sentence-transformers; silently disabled when it isn't installed.
+SEMANTIC_SIMILARITY_THRESHOLD = 0.97
+_EMBED_MODEL = None
+
+
+def _get_embed_model():
+    global _EMBED_MODEL
+    if _EMBED_MODEL is None:
+        from sentence_transformers import SentenceTransformer
+        _EMBED_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+    return _EMBED_MODEL
+
+
+def _semantic_db():
+    import sqlite3
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(os.path.join(CACHE_DIR, "semantic_index.db"))
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS entries "
+        "(namespace TEXT, text TEXT, path TEXT, embedding BLOB)"
+    )
+    return conn
+
+
+def _semantic_index_add(text: str, namespace: str, cache_path: str):
+    """Record an embedding for a freshly synthesized phrase (best effort)."""
+    try:
+        import numpy as np
+        embedding = _get_embed_model().encode(text)
+        with _semantic_db() as conn:
+            conn.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?)",
+                (namespace, text, cache_path, np.asarray(embedding, dtype=np.float32).tobytes())
+            )
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"⚠️  Semantic index update failed: {e}", file=sys.stderr)
+
+
+def _semantic_lookup(text: str, namespace: str) -> str:
+    """
+    Return the cached audio path of the closest near-duplicate prompt, or
+    None. A match needs cosine similarity >= 0.97 within the same
+    voice/speed/format namespace and a text length within 10%.
+    """
+    try:
+        import numpy as np
+        query = np.asarray(_get_embed_model().encode(text), dtype=np.float32)
+        with _semantic_db() as conn:
+            rows = conn.execute(
+                "SELECT text, path, embedding FROM entries WHERE namespace = ?",
+                (namespace,)
+            ).fetchall()
+
+        best_path = None
+        best_score = SEMANTIC_SIMILARITY_THRESHOLD
+        for cached_text, path, blob in rows:
+            if abs(len(cached_text) - len(text)) > 0.1 * len(text):
+                continue
+            candidate = np.frombuffer(blob, dtype=np.float32)
+            score = float(np.dot(query, candidate) /
+                          (np.linalg.norm(query) * np.linalg.norm(candidate) + 1e-9))
+            if score >= best_score and os.path.isfile(path):
+                best_score = score
+                best_path = path
+        return best_path
+    except ImportError:
+        return None
+    except Exception as e:
+        print(f"⚠️  Semantic lookup failed: {e}", file=sys.stderr)
+        return None
+
+
+def _evict_cache():
+    """Drop least-recently-used cache entries once the directory exceeds the cap."""
+    try:
+        entries = []
+        total = 0
+        for name in os.listdir(CACHE_DIR):
+            path = os.path.join(CACHE_DIR, name)
+            if not name.endswith((".mp3", ".ogg", ".wav")):
+                continue
+            st = os.stat(path)
+            entries.append((st.st_atime, st.st_size, path))
+            total += st.st_size
+
+        if total <= CACHE_MAX_BYTES:
+            return
+
+        # Oldest access time first
+        entries.sort()
+        for _, size, path in entries:
+            os.remove(path)
+            total -= size
+            if total <= CACHE_MAX_BYTES:
+                break
+    except OSError:
+        pass  # Eviction is best-effort; never fail a synthesis over it
+
+
+def _hard_split(piece: str, max_bytes: int) -> List[str]:
+    """
+    Last-resort split for a span with no usable sentence breaks: cut at the
+    last whitespace that fits in max_bytes, or at a clean UTF-8 byte
+    boundary when there is no whitespace at all.
+    """
+    parts = []
+    while len(piece.encode("utf-8")) > max_bytes:
+        head_bytes = piece.encode("utf-8")[:max_bytes]
+        # Back off any trailing bytes of a split multi-byte char:
+        # continuation bytes first, then a dangling lead byte
+        while head_bytes and (head_bytes[-1] & 0xC0) == 0x80:
+            head_bytes = head_bytes[:-1]
+        if head_bytes and head_bytes[-1] >= 0xC0:
+            head_bytes = head_bytes[:-1]
+        head = head_bytes.decode("utf-8")
+        ws = head.rfind(" ")
+        if ws > 0:
+            head = head[:ws]
+        parts.append(head)
+        piece = piece[len(head):].lstrip()
+    if piece:
+        parts.append(piece)
+    return parts
+
+
+def _split_text(text: str, max_bytes: int = MAX_CHUNK_BYTES) -> List[str]:
+    """
+    Split text into chunks under max_bytes, breaking at sentence boundaries
+    so each chunk synthesizes with natural prosody. Sentences that alone
+    exceed the limit (e.g. text with no punctuation) are hard-split so the
+    max_bytes invariant always holds.
+    """
+    if len(text.encode("utf-8")) <= max_bytes:
+        return [text]
+
+    sentences = []
+    start = 0
+    for i, ch in enumerate(text):
+        if ch in ".!?" and (i + 1 == len(text) or text[i + 1] == " "):
+            sentences.append(text[start:i + 1])
+            start = i + 1
+    if start < len(text):
+        sentences.append(text[start:])
+
+    pieces = []
+    for sentence in sentences:
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence.encode("utf-8")) > max_bytes:
+            pieces.extend(_hard_split(sentence, max_bytes))
+        else:
+            pieces.append(sentence)
+
+    chunks = []
+    current = ""
+    for sentence in pieces:
+        candidate = (current + " " + sentence).strip() if current else sentence.strip()
+        if current and len(candidate.encode("utf-8")) > max_bytes:
+            chunks.append(current)
+            current = sentence.strip()
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+
+    return chunks
+
+
+def _wav_data_offset(wav: bytes) -> int:
+    """Return the byte offset where the PCM payload of a WAV file starts."""
+    pos = 12  # past RIFF<size>WAVE
+    while pos + 8 <= len(wav):
+        chunk_id = wav[pos:pos + 4]
+        size = int.from_bytes(wav[pos + 4:pos + 8], "little")
+        if chunk_id == b"data":
+            return pos + 8
+        pos += 8 + size + (size & 1)  # chunks are word-aligned
+    raise ValueError("no data chunk found in WAV segment")
+
+
+def _concat_wav(segments: List[bytes]) -> bytes:
+    """
+    Splice WAV segments into one valid file: keep the first segment's
+    RIFF/fmt headers (same voice and config, so identical sample format),
+    append the raw PCM from every segment, and patch the RIFF and data
+    chunk sizes for the combined payload.
+    """
+    header_end = _wav_data_offset(segments[0])
+    pcm = b"".join(seg[_wav_data_offset(seg):] for seg in segments)
+    header = bytearray(segments[0][:header_end])
+    header[4:8] = (header_end - 8 + len(pcm)).to_bytes(4, "little")
+    header[-4:] = len(pcm).to_bytes(4, "little")  # data chunk size field
+    return bytes(header) + pcm
+
+
+def _synth_chunked(text: str, voice: str, speed: float, audio_format: str = "mp3") -> bytes:
+    """
+    Synthesize text of any length, fanning long scripts out over a thread
+    pool (the gRPC client releases the GIL on network I/O) and joining the
+    segments in order. Byte concat is valid for CBR MP3 frames from the
+    same voice/config and for chained Ogg streams; linear16 segments are
+    complete WAV files, so their PCM payloads are spliced under one header.
+    """
+    chunks = _split_text(text)
+    if len(chunks) == 1:
+        return _synth(text, voice, speed, audio_format)
+
+    print(f"Synthesizing {len(chunks)} chunks concurrently...", file=sys.stderr)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_synth, chunk, voice, speed, audio_format) for chunk in chunks]
+        segments = [f.result() for f in futures]
+    if audio_format == "linear16":
+        return _concat_wav(segments)
+    return b"".join(segments)
+
+
+@functools.lru_cache(maxsize=32)
+def _synth(text: str, voice: str, speed: float, audio_format: str = "mp3") -> bytes:
+    """
+    Call Google Cloud TTS and return the raw audio bytes.
+
+    Memoized with an in-memory LRU so repeat phrases within one process
+    (intros, outros, fallback lines) skip both the network round-trip
+    and the disk cache. maxsize is kept small because entries are raw
+    audio (~0.5-2 MB each), so a long-lived --serve worker tops out
+    around tens of MB; cold repeats still hit the capped disk cache.
+    """
+    client = _get_client()
+
+    synthesis_input = texttospeech.SynthesisInput(text=text)
+
+    voice_params = texttospeech.VoiceSelectionParams(
+        language_code="en-US",
+        name=voice
+    )
+
+    audio_config = texttospeech.AudioConfig(
+        audio_encoding=getattr(texttospeech.AudioEncoding, AUDIO_FORMATS[audio_format][0]),
+        speaking_rate=speed
+    )
+
+    print(f"Generating audio with Google Cloud TTS (voice: {voice})...", file=sys.stderr)
+
+    response = client.synthesize_speech(
+        input=synthesis_input,
+        voice=voice_params,
+        audio_config=audio_config
+    )
+
+    return response.audio_content
+
+
+def generate_audio(text: str, output_path: str, voice: str = None, speed: float = 1.0,
+                   use_cache: bool = True, audio_format: str = "mp3",
+                   allow_semantic_cache: bool = False) -> Dict[str, Any]:
     """
     Generate audio using Google Cloud Text-to-Speech.
 
@@ -21,40 +371,91 @@ def generate_audio(text: str, output_path: str, voice: str = None, speed: float
         output_path: Path to save the audio file
         voice: Voice name (e.g., "en-US-Neural2-J")
         speed: Speech speed
+        use_cache: Set False to bypass all caches (sensitive prompts)
+        audio_format: Output encoding - "mp3", "opus" (smallest), or "linear16"
+        allow_semantic_cache: Also serve cached audio for near-duplicate
+            prompts (cosine similarity >= 0.97); needs sentence-transformers
 
     Returns:
         Dict with status and audio_path
     """
-    try:
+    # Validate up front so malformed requests cost microseconds, not a
+    # network round-trip to collect a rejection
+    if not text or not text.strip():
+        return {
+            "status": "error",
+            "message": "No text provided"
+        }
 
-        client = texttospeech.TextToSpeechClient()
+    if not 0.25 <= speed <= 4.0:
+        return {
+            "status": "error",
+            "message": f"Speed {speed} out of range (Google TTS allows 0.25-4.0)"
+        }
+
+    try:
 
-        synthesis_input = texttospeech.SynthesisInput(text=text)
+        if audio_format not in AUDIO_FORMATS:
+            return {
+                "status": "error",
+                "message": f"Unknown audio format: {audio_format} (expected one of {sorted(AUDIO_FORMATS)})"
+            }
 
         # Default to a professional news voice
         if not voice:
             voice = "en-US-Neural2-F"  # Female professional voice
 
-        voice_params = texttospeech.VoiceSelectionParams(
-            language_code="en-US",
-            name=voice
-        )
+        # Check the on-disk cache before paying for a synthesis call
+        suffix = AUDIO_FORMATS[audio_format][1]
+        cache_path = os.path.join(CACHE_DIR, f"{_cache_key(text, voice, speed, audio_format)}{suffix}")
+        if use_cache and os.path.isfile(cache_path):
+            # copyfile uses zero-copy kernel paths (sendfile/CopyFileEx),
+            # so a hit never pulls the audio through userspace
+            shutil.copyfile(cache_path, output_path)
+            print(f"✅ Cache hit, audio copied to {output_path}", file=sys.stderr)
+            return {
+                "status": "success",
+                "audio_path": output_path,
+                "provider": "google",
+                "voice": voice,
+                "format": audio_format,
+                "cache": "hit"
+            }
 
-        audio_config = texttospeech.AudioConfig(
-            audio_encoding=texttospeech.AudioEncoding.MP3,
-            speaking_rate=speed
-        )
+        # After an exact-key miss, optionally try near-duplicate prompts
+        namespace = f"{voice}|{speed}|{audio_format}|en-US"
+        if use_cache and allow_semantic_cache:
+            semantic_path = _semantic_lookup(text, namespace)
+            if semantic_path:
+                shutil.copyfile(semantic_path, output_path)
+                print(f"✅ Semantic cache hit, audio copied to {output_path}", file=sys.stderr)
+                return {
+                    "status": "success",
+                    "audio_path": output_path,
+                    "provider": "google",
+                    "voice": voice,
+                    "format": audio_format,
+                    "cache": "semantic-hit"
+                }
 
-        print(f"Generating audio with Google Cloud TTS (voice: {voice})...", file=sys.stderr)
-
-        response = client.synthesize_speech(
-            input=synthesis_input,
-            voice=voice_params,
-            audio_config=audio_config
-        )
+        if use_cache:
+            audio_content = _synth_chunked(text, voice, speed, audio_format)
+        else:
+            segments = [
+                _synth.__wrapped__(chunk, voice, speed, audio_format) for chunk in _split_text(text)
+            ]
+            if audio_format == "linear16" and len(segments) > 1:
+                audio_content = _concat_wav(segments)
+            else:
+                audio_content = b"".join(segments)
 
         with open(output_path, "wb") as f:
-            f.write(response.audio_content)
+            f.write(audio_content)
+
+        if use_cache:
+            _cache_store(cache_path, audio_content)
+            if allow_semantic_cache:
+                _semantic_index_add(text, namespace, cache_path)
 
         print(f"✅ Audio saved to {output_path}", file=sys.stderr)
 
@@ -62,7 +463,8 @@ def generate_audio(text: str, output_path: str, voice: str = None, speed: float
             "status": "success",
             "audio_path": output_path,
             "provider": "google",
-            "voice": voice
+            "voice": voice,
+            "format": audio_format
         }
 
     except ImportError:
@@ -77,29 +479,224 @@ def generate_audio(text: str, output_path: str, voice: str = None, speed: float
         }
 
 
+def _upload_to_heygen(audio_bytes: bytes, api_key: str, content_type: str) -> str:
+    """Upload raw audio bytes to HeyGen and return the asset URL."""
+    import requests
+
+    headers = {
+        "X-Api-Key": api_key,
+        "Content-Type": content_type
+    }
+    response = requests.post("https://upload.heygen.com/v1/asset",
+                             headers=headers, data=audio_bytes)
+    response.raise_for_status()
+    return response.json().get("data", {}).get("url")
+
+
+def generate_audio_and_upload(text: str, output_path: str = "output.mp3", voice: str = None,
+                              speed: float = 1.0, audio_format: str = "mp3",
+                              heygen_api_key: str = None) -> Dict[str, Any]:
+    """
+    Synthesize audio and upload it to HeyGen in one process.
+
+    The upload starts as soon as the synthesized bytes exist in memory and
+    runs concurrently with the disk write, so the downstream avatar-video
+    step skips the usual write-file / new-process / re-read-and-upload
+    sequence entirely.
+
+    Returns:
+        Dict with status, audio_path and audio_url
+    """
+    api_key = heygen_api_key or os.getenv("HEYGEN_API_KEY")
+    if not api_key:
+        return {
+            "status": "error",
+            "message": "HEYGEN_API_KEY not set in environment"
+        }
+
+    result = {}
+    try:
+        if not voice:
+            voice = "en-US-Neural2-F"
+
+        audio_content = _synth_chunked(text, voice, speed, audio_format)
+
+        # Overlap the network-bound upload with the disk-bound write
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            upload_future = executor.submit(
+                _upload_to_heygen, audio_content, api_key, AUDIO_FORMATS[audio_format][2]
+            )
+
+            with open(output_path, "wb") as f:
+                f.write(audio_content)
+
+            audio_url = upload_future.result()
+
+        if not audio_url:
+            return {
+                "status": "error",
+                "message": "Failed to upload audio to HeyGen"
+            }
+
+        print(f"✅ Audio saved to {output_path} and uploaded: {audio_url}", file=sys.stderr)
+
+        result = {
+            "status": "success",
+            "audio_path": output_path,
+            "audio_url": audio_url,
+            "provider": "google",
+            "voice": voice,
+            "format": audio_format
+        }
+    except Exception as e:
+        result = {
+            "status": "error",
+            "message": str(e)
+        }
+    return result
+
+
+def _handle_request(req: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one JSON request dict through generate_audio.
+
+    Requests with "upload_to_heygen": true go through
+    generate_audio_and_upload instead, which overlaps the HeyGen asset
+    upload with the disk write and returns audio_url alongside audio_path.
+    """
+    try:
+        text = req.get("text", "")
+        if not text:
+            return {"status": "error", "message": "No text provided"}
+        if req.get("upload_to_heygen"):
+            return generate_audio_and_upload(
+                text,
+                req.get("output_path", "output.mp3"),
+                req.get("voice"),
+                req.get("speed", 1.0),
+                audio_format=req.get("audio_format", "mp3"),
+                heygen_api_key=req.get("heygen_api_key")
+            )
+        return generate_audio(
+            text,
+            req.get("output_path", "output.mp3"),
+            req.get("voice"),
+            req.get("speed", 1.0),
+            audio_format=req.get("audio_format", "mp3")
+        )
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+
+# Micro-batching for worker mode: requests arriving within a short window are
+# drained together and dispatched in parallel, so N near-simultaneous jobs
+# cost roughly one synthesis latency instead of N serialized ones
+BATCH_MAX = 16
+BATCH_WINDOW_MS = 10
+_BATCH_QUEUE: "queue.Queue" = queue.Queue()
+_BATCH_THREAD: Optional[threading.Thread] = None
+_BATCH_LOCK = threading.Lock()
+
+
+def _batch_worker():
+    executor = ThreadPoolExecutor(max_workers=16)
+    while True:
+        batch = [_BATCH_QUEUE.get()]
+        deadline = time.monotonic() + BATCH_WINDOW_MS / 1000.0
+        while len(batch) < BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_BATCH_QUEUE.get(timeout=remaining))
+            except queue.Empty:
+                break
+
+        for req, fut in batch:
+            executor.submit(_run_batched, req, fut)
+
+
+def _run_batched(req: Dict[str, Any], fut: Future):
+    try:
+        fut.set_result(_handle_request(req))
+    except Exception as e:
+        fut.set_exception(e)
+
+
+def submit_audio_request(req: Dict[str, Any]) -> Future:
+    """Enqueue a request for batched dispatch; returns a Future of the result."""
+    global _BATCH_THREAD
+    if _BATCH_THREAD is None:
+        with _BATCH_LOCK:
+            if _BATCH_THREAD is None:
+                _BATCH_THREAD = threading.Thread(target=_batch_worker, daemon=True)
+                _BATCH_THREAD.start()
+
+    fut: Future = Future()
+    _BATCH_QUEUE.put((req, fut))
+    return fut
+
+
+def serve():
+    """
+    Long-running worker mode: read newline-delimited JSON requests from stdin
+    and write one JSON response per line to stdout. Lets the Go side keep a
+    single Python process (interpreter start, google.cloud import, gRPC
+    channel, ADC discovery) alive across many jobs.
+
+    Requests are pipelined through the batching queue, so responses keep
+    stdin order but near-simultaneous jobs synthesize in parallel.
+    """
+    pending: "queue.Queue" = queue.Queue()
+    done = object()
+
+    def writer():
+        while True:
+            fut = pending.get()
+            if fut is done:
+                return
+            try:
+                resp = fut.result()
+            except Exception as e:
+                resp = {"status": "error", "message": str(e)}
+            sys.stdout.write(json.dumps(resp) + "\n")
+            sys.stdout.flush()
+
+    writer_thread = threading.Thread(target=writer, daemon=True)
+    writer_thread.start()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except json.JSONDecodeError as e:
+            fut: Future = Future()
+            fut.set_result({"status": "error", "message": f"Invalid JSON input: {str(e)}"})
+            pending.put(fut)
+            continue
+        pending.put(submit_audio_request(req))
+
+    pending.put(done)
+    writer_thread.join()
+
+
 def main():
     """
     CLI interface for TTS generation using Google Cloud TTS.
-    Supports both command-line args and JSON stdin input.
+    Supports command-line args, JSON stdin input, and --serve worker mode.
     """
+    # Long-running worker mode (one JSON request per line)
+    if "--serve" in sys.argv:
+        serve()
+
     # Check for stdin JSON input (for Go integration)
-    if not sys.stdin.isatty():
+    elif not sys.stdin.isatty():
         try:
             input_data = json.loads(sys.stdin.read())
 
-            text = input_data.get("text", "")
-            output_path = input_data.get("output_path", "output.mp3")
-            voice = input_data.get("voice")
-            speed = input_data.get("speed", 1.0)
-
-            if not text:
-                print(json.dumps({
-                    "status": "error",
-                    "message": "No text provided"
-                }))
-                return
-
-            result = generate_audio(text, output_path, voice, speed)
+            # Same dispatch as worker mode, including "upload_to_heygen"
+            result = _handle_request(input_data)
             print(json.dumps(result))
 
         except json.JSONDecodeError as e:
@@ -125,6 +722,8 @@ def main():
         print("Usage:")
         print("  CLI: python tts_generation.py 'your text' [output.mp3]")
         print("  JSON stdin: echo '{\"text\":\"...\",\"output_path\":\"...\"}' | python tts_generation.py")
+        print("  Worker mode: python tts_generation.py --serve  (one JSON request per line)")
+        print("  Add \"upload_to_heygen\": true to also upload the audio as a HeyGen asset")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+"""
+Video generation defaults - SINGLE SOURCE OF TRUTH
+Change these values to update defaults across the entire application
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class VideoDefaults:
+    """Immutable bundle of HeyGen rendering defaults.
+
+    Frozen so nothing can drift at runtime, slotted so attribute access
+    skips the instance dict. Keeping (avatar_id, voice_id) together in one
+    hashable object also makes them safe to use in cache keys.
+    """
+
+    # HeyGen avatar and TTS voice
+    avatar_id: str = "Marcus_expressive_2024120201"
+    voice_id: str = "581b6c108c494cc1abe823e7f72f3fae"
+
+    # Background: type and fallback solid color (dark professional news studio)
+    background: str = "newsroom"
+    background_color: str = "#1a2332"
+
+    # Speech speed: 0.5 (slow) to 1.5 (fast), 1.0 is normal
+    speech_speed: float = 1.25
+
+    # Video dimensions - Portrait mode (9:16 for TikTok/Instagram Reels/YouTube Shorts)
+    width: int = 720
+    height: int = 1280
+    aspect_ratio: str = "9:16"  # Options: "16:9" (landscape), "9:16" (portrait), "1:1" (square)
+
+
+DEFAULTS = VideoDefaults()
@@ -1,22 +0,0 @@
-"""
-Video generation constants - SINGLE SOURCE OF TRUTH
-Change these values to update defaults across the entire application
-"""
-
-# Default avatar ID for HeyGen
-DEFAULT_AVATAR_ID = "Marcus_expressive_2024120201"
-
-# Default voice ID for HeyGen TTS
-DEFAULT_VOICE_ID = "581b6c108c494cc1abe823e7f72f3fae"
-
-# Default background type
-DEFAULT_BACKGROUND = "newsroom"
-
-# Default background color (fallback solid color)
-DEFAULT_BACKGROUND_COLOR = "#1a2332"
-
-# Video dimensions - Portrait mode (9:16 for TikTok/Instagram Reels/YouTube Shorts)
-DEFAULT_VIDEO_WIDTH = 720
-DEFAULT_VIDEO_HEIGHT = 1280
-DEFAULT_ASPECT_RATIO = "9:16"  # Options: "16:9" (landscape), "9:16" (portrait), "1:1" (square)
-
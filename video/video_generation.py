@@ -4,30 +4,374 @@ Video Generation Module using HeyGen AI Avatar
 Generates talking head videos with AI avatars using text-to-speech or audio
 """
 
+import io
 import os
 import sys
 import json
-import requests
+import logging
 import time
-import subprocess
+import random
+import hashlib
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
-import base64
 
-# Constants - SINGLE SOURCE OF TRUTH
-# Change these values to update defaults across the entire application
-DEFAULT_AVATAR_ID = "Marcus_expressive_2024120201"
-DEFAULT_VOICE_ID = "581b6c108c494cc1abe823e7f72f3fae"
-DEFAULT_BACKGROUND = "newsroom"
-DEFAULT_BACKGROUND_COLOR = "#1a2332"  # Dark professional news studio color
-DEFAULT_SPEECH_SPEED = 1.25  # Speech speed: 0.5 (slow) to 1.5 (fast), 1.0 is normal
+# requests (which drags in urllib3, ssl, http.client...) is imported lazily
+# on first network use, so --help and usage runs don't pay ~100ms+ for it
 
-# Video dimensions - Portrait mode (9:16 for TikTok/Instagram Reels/YouTube Shorts)
-DEFAULT_VIDEO_WIDTH = 720
-DEFAULT_VIDEO_HEIGHT = 1280
-DEFAULT_ASPECT_RATIO = "9:16"  # Options: "16:9" (landscape), "9:16" (portrait), "1:1" (square)
+# orjson parses 3-10x faster than stdlib json and works on bytes directly;
+# fall back to the stdlib so the module never hard-depends on it
+try:
+    import orjson
 
+    def _json_loads(data):
+        return orjson.loads(data)
 
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
 
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that skips the per-record flush.
+
+    The stock handler flushes after every record, turning each progress line
+    into a write(2) syscall - 100+ extra syscalls per poll loop. Records
+    accumulate in the 8 KiB buffer below and drain when it fills, at most a
+    few seconds after they are logged, immediately for WARNING and above,
+    and on logging.shutdown()'s atexit flush (flush itself is untouched so
+    buffered lines are never lost at interpreter exit).
+    """
+
+    _FLUSH_INTERVAL = 5.0
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if (record.levelno >= logging.WARNING
+                    or now - getattr(self, "_last_flush", 0.0) >= self._FLUSH_INTERVAL):
+                self.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+# All progress/diagnostic output goes through one buffered stderr logger
+# rather than unbuffered print() calls; stdout stays reserved for JSON results
+logger = logging.getLogger("heygen")
+if not logger.handlers:
+    try:
+        _log_stream = io.TextIOWrapper(io.BufferedWriter(sys.stderr.buffer, 8192),
+                                       write_through=False)
+        _handler = _BufferedStreamHandler(_log_stream)
+    except AttributeError:  # sys.stderr replaced by something without .buffer
+        _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Defaults live in config.py (single source of truth); these aliases keep
+# existing call sites and the Go integration contract unchanged
+try:
+    from config import DEFAULTS
+except ImportError:  # imported as part of a package rather than run as a script
+    from .config import DEFAULTS
+
+DEFAULT_AVATAR_ID = DEFAULTS.avatar_id
+DEFAULT_VOICE_ID = DEFAULTS.voice_id
+DEFAULT_BACKGROUND = DEFAULTS.background
+DEFAULT_BACKGROUND_COLOR = DEFAULTS.background_color
+DEFAULT_SPEECH_SPEED = DEFAULTS.speech_speed
+DEFAULT_VIDEO_WIDTH = DEFAULTS.width
+DEFAULT_VIDEO_HEIGHT = DEFAULTS.height
+DEFAULT_ASPECT_RATIO = DEFAULTS.aspect_ratio
+
+# One pooled session for the whole module: the upload, create, status polls
+# and download all reuse a keep-alive connection instead of paying a fresh
+# TCP+TLS handshake per call. The HeyGen hosts get their own mounts so the
+# poll-heavy API pool is never evicted by upload/download traffic. Built
+# lazily on first use so importing the module stays cheap.
+_SESSION = None
+
+
+def _get_session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        session = requests.Session()
+        session.mount("https://api.heygen.com", adapter)
+        session.mount("https://upload.heygen.com", adapter)
+        session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        ))
+        _SESSION = session
+    return _SESSION
+
+# The API key is resolved once at import and the auth header dicts are
+# prebuilt; the entry points were each re-reading the environment and
+# allocating fresh header dicts per call, which is pure overhead once the
+# daemon mode keeps this process alive across many jobs
+_API_KEY = os.environ.get("HEYGEN_API_KEY")
+_AUTH_HEADERS = {"X-Api-Key": _API_KEY} if _API_KEY else None
+_JSON_HEADERS = {**_AUTH_HEADERS, "Content-Type": "application/json"} if _API_KEY else None
+
+# Status endpoint compiled once; poll loops pass the video id via params=
+# so the session reuses the parsed URL instead of re-parsing a fresh
+# f-string on every iteration
+_STATUS_URL = "https://api.heygen.com/v1/video_status.get"
+
+# Invariant portion of every video/generate payload; merged per call so the
+# hot path only builds the job-specific video_inputs
+_BASE_PAYLOAD = {
+    "dimension": {
+        "width": DEFAULT_VIDEO_WIDTH,
+        "height": DEFAULT_VIDEO_HEIGHT
+    },
+    "aspect_ratio": DEFAULT_ASPECT_RATIO,
+    "test": False
+}
+
+# Finished avatar videos are cached by content: same audio + avatar +
+# background means the same render, so skip the 5-10 minute HeyGen pipeline
+CACHE_DIR = os.environ.get("HEYGEN_CACHE_DIR", os.path.expanduser("~/.cache/heygen"))
+
+# Upload content types for the audio formats the TTS module can produce
+_AUDIO_CONTENT_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".ogg": "audio/ogg",
+    ".opus": "audio/ogg",
+    ".wav": "audio/wav"
+}
+
+
+def _audio_content_type(audio_path: str) -> str:
+    """Pick the upload Content-Type from the audio file extension."""
+    ext = os.path.splitext(audio_path)[1].lower()
+    return _AUDIO_CONTENT_TYPES.get(ext, "audio/mpeg")
+
+
+# Magic-byte prefixes for image detection; covers mislabeled files and
+# formats the old extension check missed (GIF, WebP)
+_IMAGE_MAGIC = [
+    (b'\x89PNG\r\n\x1a\n', "image/png"),
+    (b'\xff\xd8\xff', "image/jpeg"),
+    (b'GIF87a', "image/gif"),
+    (b'GIF89a', "image/gif"),
+]
+
+
+def _image_content_type(image_path: str) -> str:
+    """Detect the image Content-Type from the first 12 bytes of the file."""
+    with open(image_path, "rb") as f:
+        head = f.read(12)
+    for prefix, content_type in _IMAGE_MAGIC:
+        if head.startswith(prefix):
+            return content_type
+    # WebP is a RIFF container; check the fourcc so WAV/AVI (also RIFF)
+    # don't get uploaded as image/webp
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return "image/webp"
+    return "image/jpeg"
+
+
+def _upload_background_image(background_image: str, api_key: str) -> Optional[str]:
+    """
+    Resolve a local background image to a HeyGen asset URL: serve it from the
+    content-hash cache when possible, otherwise upload and record it.
+    Returns None on failure so callers can fall back to the default backdrop.
+    """
+    cached_url, bg_hash = _bg_asset_lookup(background_image)
+    if cached_url:
+        logger.info(f"✅ Reusing cached background asset: {cached_url}")
+        return cached_url
+
+    logger.info(f"Uploading background image: {background_image}")
+    upload_headers = {
+        "X-Api-Key": api_key,
+        "Content-Type": _image_content_type(background_image),
+        # Explicit length lets the server skip chunked transfer decoding
+        "Content-Length": str(os.path.getsize(background_image))
+    }
+
+    # Pass the file handle so requests streams the body in chunks
+    # instead of holding the full image in memory
+    with open(background_image, "rb") as img_file:
+        upload_response = _get_session().post("https://upload.heygen.com/v1/asset",
+                                        headers=upload_headers, data=img_file)
+    if not (200 <= upload_response.status_code < 300):
+        logger.info(f"⚠️  Background upload failed: HTTP {upload_response.status_code}")
+        return None
+    try:
+        image_url = _json_loads(upload_response.content)["data"]["url"]
+    except (ValueError, KeyError, TypeError):
+        image_url = None
+
+    if image_url:
+        logger.info(f"✅ Background image uploaded successfully")
+        _bg_asset_store(background_image, bg_hash, image_url)
+    return image_url
+
+
+# Uploaded background images are content-addressed so the same newsroom
+# backdrop is never uploaded twice. The JSON file maps blake2b(content) to
+# the HeyGen asset URL; the in-process memo maps (path, mtime, size) to the
+# same so unchanged files skip even the hash computation.
+_BG_ASSETS_PATH = os.path.join(CACHE_DIR, "bg_assets.json")
+_BG_MEMO: Dict[tuple, tuple] = {}
+
+
+def _bg_asset_lookup(path: str):
+    """Return (cached asset URL or None, content hash) for a background image."""
+    try:
+        st = os.stat(path)
+        memo_key = (path, st.st_mtime, st.st_size)
+        if memo_key in _BG_MEMO:
+            return _BG_MEMO[memo_key]
+
+        h = hashlib.blake2b(digest_size=16)
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        content_hash = h.hexdigest()
+
+        assets = {}
+        try:
+            with open(_BG_ASSETS_PATH) as f:
+                assets = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        url = assets.get(content_hash)
+        if url:
+            _BG_MEMO[memo_key] = (url, content_hash)
+        return url, content_hash
+    except OSError:
+        return None, None
+
+
+def _bg_asset_store(path: str, content_hash: str, url: str):
+    """Persist a freshly uploaded asset URL under its content hash (best effort)."""
+    if not content_hash:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        assets = {}
+        try:
+            with open(_BG_ASSETS_PATH) as f:
+                assets = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            pass
+        assets[content_hash] = url
+
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(assets, f)
+        os.replace(tmp_path, _BG_ASSETS_PATH)
+
+        st = os.stat(path)
+        _BG_MEMO[(path, st.st_mtime, st.st_size)] = (url, content_hash)
+    except OSError:
+        pass
+
+
+def _hash_audio_file(audio_path: str) -> "hashlib._Hash":
+    """Stream the audio file into a sha256 so memory stays flat."""
+    h = hashlib.sha256()
+    with open(audio_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h
+
+
+def _video_cache_key(audio_path: str, avatar_id: str, background: str) -> str:
+    """Cache key covering everything that affects the rendered video."""
+    h = _hash_audio_file(audio_path)
+    h.update(avatar_id.encode())
+    h.update(background.encode())
+    h.update(f"{DEFAULT_VIDEO_WIDTH}x{DEFAULT_VIDEO_HEIGHT}".encode())
+    return h.hexdigest()
+
+
+def _video_cache_store(key: str, video_path: str, metadata: Dict[str, Any]):
+    """Atomically copy the finished video and its metadata into the cache."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        shutil.copyfile(video_path, tmp_path)
+        os.replace(tmp_path, os.path.join(CACHE_DIR, f"{key}.mp4"))
+
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(metadata, f)
+        os.replace(tmp_path, os.path.join(CACHE_DIR, f"{key}.json"))
+    except OSError as e:
+        logger.info(f"⚠️  Warning: failed to cache video: {e}")
+
+
+# Downloads at or above this size are handed to aria2c when it is installed;
+# parallel range requests saturate bandwidth a single TCP stream cannot
+_PARALLEL_DOWNLOAD_MIN_BYTES = 16 << 20
+
+
+def _download_video(video_url: str, output_path: str):
+    """
+    Download the finished MP4. Files at or above the parallel threshold go
+    through aria2c with 8 range connections; everything else (and any aria2c
+    failure) streams through the pooled session in 1 MiB chunks so peak
+    memory stays at one chunk instead of the whole file.
+    """
+    session = _get_session()
+    length = 0
+    try:
+        head = session.head(video_url, allow_redirects=True, timeout=30)
+        length = int(head.headers.get("Content-Length", 0))
+    except Exception:
+        pass  # size unknown - use the streamed path
+
+    if length >= _PARALLEL_DOWNLOAD_MIN_BYTES and shutil.which("aria2c"):
+        import subprocess
+
+        logger.info(f"Downloading with aria2c ({length >> 20} MiB, 8 connections)...")
+        proc = subprocess.run(
+            ["aria2c", "-x", "8", "-s", "8", "--allow-overwrite=true",
+             "-d", os.path.dirname(os.path.abspath(output_path)),
+             "-o", os.path.basename(output_path), video_url],
+            capture_output=True
+        )
+        if proc.returncode == 0:
+            return
+        logger.info("⚠️  aria2c failed, falling back to streamed download")
+
+    with session.get(video_url, stream=True, timeout=120) as video_response:
+        video_response.raise_for_status()
+        length = int(video_response.headers.get("Content-Length", 0))
+        with open(output_path, "wb") as f:
+            # Pre-size the file when the length is known to avoid
+            # fragmentation and repeated metadata updates
+            if length and hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, length)
+            for chunk in video_response.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
 
 
 def generate_avatar_video_from_text(
@@ -67,17 +411,30 @@ def generate_avatar_video_from_text(
         - "581b6c108c494cc1abe823e7f72f3fae" - Authoritative male (US)
         - "40421c2ce32f48da9c1e821ac6d1b7f6" - British female
     """
+    # Validate before any network call
+    if not text or not text.strip():
+        return {
+            "status": "error",
+            "message": "No text provided"
+        }
+
     try:
-        api_key = os.getenv("HEYGEN_API_KEY")
-        if not api_key:
+        if _AUTH_HEADERS is None:
             return {
                 "status": "error",
                 "message": "HEYGEN_API_KEY not set in environment"
             }
+        api_key = _API_KEY
+
+        logger.info(f"Generating avatar video from text ({len(text)} chars)")
 
-        print(f"Generating avatar video from text ({len(text)} chars)", file=sys.stderr)
+        # Fall back to a globally configured webhook endpoint
+        callback_url = callback_url or os.getenv("HEYGEN_CALLBACK_URL")
 
-        # Determine background configuration
+        # Determine background configuration. A local file is uploaded on a
+        # worker thread while the rest of the payload is assembled; only the
+        # "background" slot waits on the upload.
+        bg_upload = None
         bg_config = {}
         if background == "newsroom":
             # Use default newsroom background (professional news studio)
@@ -88,44 +445,7 @@ def generate_avatar_video_from_text(
         elif background_image:
             # Check if it's a local file or URL
             if os.path.isfile(background_image):
-                # Upload local file to HeyGen
-                print(f"Uploading background image: {background_image}", file=sys.stderr)
-                upload_url = "https://upload.heygen.com/v1/asset"
-
-                with open(background_image, "rb") as img_file:
-                    image_data = img_file.read()
-
-                # Detect content type from file extension, default to jpeg
-                content_type = "image/jpeg"
-                if background_image.lower().endswith('.png'):
-                    # Check if it's actually a PNG by looking at magic bytes
-                    if image_data[:8] == b'\x89PNG\r\n\x1a\n':
-                        content_type = "image/png"
-
-                upload_headers = {
-                    "X-Api-Key": api_key,
-                    "Content-Type": content_type
-                }
-
-                upload_response = requests.post(upload_url, headers=upload_headers, data=image_data)
-                upload_response.raise_for_status()
-                upload_data = upload_response.json()
-
-                # Get the uploaded image URL
-                image_url = upload_data.get("data", {}).get("url")
-
-                if not image_url:
-                    print(f"⚠️  Warning: Failed to upload background image, using default", file=sys.stderr)
-                    bg_config = {
-                        "type": "color",
-                        "value": DEFAULT_BACKGROUND_COLOR
-                    }
-                else:
-                    print(f"✅ Background image uploaded successfully", file=sys.stderr)
-                    bg_config = {
-                        "type": "image",
-                        "url": image_url
-                    }
+                bg_upload = background_image
             else:
                 # It's already a URL
                 bg_config = {
@@ -144,50 +464,66 @@ def generate_avatar_video_from_text(
             }
 
         # Create video with text-to-speech
-        print("Creating avatar video with TTS...", file=sys.stderr)
+        logger.info("Creating avatar video with TTS...")
         create_url = "https://api.heygen.com/v2/video/generate"
 
-        headers = {
-            "X-Api-Key": api_key,
-            "Content-Type": "application/json"
-        }
-
-        payload = {
-            "caption": True,
-            "video_inputs": [{
-                "character": {
-                    "type": "avatar",
-                    "avatar_id": avatar_id,
-                    "avatar_style": "normal"
-                },
-                "voice": {
-                    "type": "text",
-                    "input_text": text,
-                    "voice_id": voice_id,
-                    "speed": speech_speed,
-                    "emotion": "Broadcaster",
-                    "elevanlabs_settings": {
-                        "model": "eleven_turbo_v2",
-                        "similarity_boost": 3.4,
-                        "stability": 3.4
+        headers = _JSON_HEADERS
+
+        def _assemble_payload() -> Dict[str, Any]:
+            """Everything except the background slot, built while the
+            background upload (if any) is in flight."""
+            payload = {
+                **_BASE_PAYLOAD,
+                "caption": True,
+                "video_inputs": [{
+                    "character": {
+                        "type": "avatar",
+                        "avatar_id": avatar_id,
+                        "avatar_style": "normal"
+                    },
+                    "voice": {
+                        "type": "text",
+                        "input_text": text,
+                        "voice_id": voice_id,
+                        "speed": speech_speed,
+                        "emotion": "Broadcaster",
+                        "elevanlabs_settings": {
+                            "model": "eleven_turbo_v2",
+                            "similarity_boost": 3.4,
+                            "stability": 3.4
+                        }
                     }
-                },
-                "background": bg_config
-            }],
-            "dimension": {
-                "width": DEFAULT_VIDEO_WIDTH,
-                "height": DEFAULT_VIDEO_HEIGHT
-            },
-            "aspect_ratio": DEFAULT_ASPECT_RATIO,
-            "test": False
-        }
+                }]
+            }
+            # Add callback URL if provided (for webhook-based completion)
+            if callback_url:
+                payload["callback_id"] = callback_url
+                logger.info(f"Using webhook callback: {callback_url}")
+            return payload
+
+        if bg_upload:
+            # The with-block joins the worker even if .result() raises
+            with ThreadPoolExecutor(max_workers=1) as bg_executor:
+                bg_future = bg_executor.submit(_upload_background_image, bg_upload, api_key)
+                payload = _assemble_payload()
+                image_url = bg_future.result()
+            if image_url:
+                bg_config = {
+                    "type": "image",
+                    "url": image_url
+                }
+            else:
+                logger.info(f"⚠️  Warning: Failed to upload background image, using default")
+                bg_config = {
+                    "type": "color",
+                    "value": DEFAULT_BACKGROUND_COLOR
+                }
+        else:
+            payload = _assemble_payload()
 
-        # Add callback URL if provided (for webhook-based completion)
-        if callback_url:
-            payload["callback_id"] = callback_url
-            print(f"Using webhook callback: {callback_url}", file=sys.stderr)
+        payload["video_inputs"][0]["background"] = bg_config
 
-        create_response = requests.post(create_url, json=payload, headers=headers)
+        create_response = _get_session().post(create_url, data=_json_dumps(payload), headers=headers)
         create_response.raise_for_status()
         video_id = create_response.json().get("data", {}).get("video_id")
 
@@ -198,11 +534,11 @@ def generate_avatar_video_from_text(
                 "details": create_response.json()
             }
 
-        print(f"Video creation started. ID: {video_id}", file=sys.stderr)
+        logger.info(f"Video creation started. ID: {video_id}")
 
         # If using webhook, return immediately without polling
         if callback_url:
-            print(f"✅ Video submitted with webhook. Will notify: {callback_url}", file=sys.stderr)
+            logger.info(f"✅ Video submitted with webhook. Will notify: {callback_url}")
             return {
                 "status": "processing",
                 "video_id": video_id,
@@ -210,21 +546,34 @@ def generate_avatar_video_from_text(
                 "callback_url": callback_url
             }
 
-        # Poll for completion
-        status_url = f"https://api.heygen.com/v1/video_status.get?video_id={video_id}"
-        max_attempts = 240  # 20 minutes max wait (portrait videos can take longer)
-        attempt = 0
-
-        while attempt < max_attempts:
-            time.sleep(5)
-            attempt += 1
-
-            status_response = requests.get(status_url, headers=headers)
+        # Poll for completion with exponential backoff - fast jobs are detected
+        # within seconds, slow jobs back off to one call per 30s
+        status_params = {"video_id": video_id}
+        timeout_seconds = 1200  # 20 minutes max wait (portrait videos can take longer)
+        deadline = time.monotonic() + timeout_seconds
+        delay = 2.0
+        last_status = None
+        etag = None  # conditional GET: a 304 reply is header-only
+
+        while time.monotonic() < deadline:
+            # Jitter avoids thundering-herd polling across parallel jobs
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(30.0, 1.5 * delay)
+            elapsed = timeout_seconds - (deadline - time.monotonic())
+
+            poll_headers = headers if etag is None else {**headers, "If-None-Match": etag}
+            status_response = _get_session().get(_STATUS_URL, params=status_params, headers=poll_headers)
+            if status_response.status_code == 304:
+                continue  # Not Modified: status unchanged, keep polling
             status_response.raise_for_status()
-            status_data = status_response.json().get("data", {})
+            etag = status_response.headers.get("ETag", etag)
+            status_data = _json_loads(status_response.content).get("data", {})
 
             video_status = status_data.get("status")
-            print(f"Status: {video_status} ({attempt}/{max_attempts})", file=sys.stderr)
+            # Only log transitions - the status repeats for dozens of polls
+            if video_status != last_status:
+                logger.info(f"Status: {video_status} ({elapsed:.0f}s/{timeout_seconds}s)")
+                last_status = video_status
 
             if video_status == "completed":
                 video_url = status_data.get("video_url")
@@ -235,15 +584,10 @@ def generate_avatar_video_from_text(
                         "message": "Video completed but no URL provided"
                     }
 
-                # Download the video
-                print(f"Downloading video to {output_path}...", file=sys.stderr)
-                video_response = requests.get(video_url, timeout=120)
-                video_response.raise_for_status()
-
-                with open(output_path, "wb") as f:
-                    f.write(video_response.content)
+                logger.info(f"Downloading video to {output_path}...")
+                _download_video(video_url, output_path)
 
-                print(f"✅ Video saved to {output_path}", file=sys.stderr)
+                logger.info(f"✅ Video saved to {output_path}")
 
                 result = {
                     "status": "success",
@@ -267,7 +611,7 @@ def generate_avatar_video_from_text(
         }
 
     except Exception as e:
-        print(f"Error: {str(e)}", file=sys.stderr)
+        logger.info(f"Error: {str(e)}")
         return {
             "status": "error",
             "message": str(e)
@@ -278,7 +622,8 @@ def generate_avatar_video(
     audio_path: str,
     output_path: str = "output.mp4",
     avatar_id: str = "Marcus_expressive_2024120201",
-    background: str = "newsroom"
+    background: str = "newsroom",
+    callback_url: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Generate a talking head video using HeyGen with pre-recorded audio.
@@ -288,58 +633,101 @@ def generate_avatar_video(
         output_path: Path to save the generated video
         avatar_id: HeyGen avatar ID (see available avatars in HeyGen dashboard)
         background: Background color or image URL
+        callback_url: Optional webhook URL for completion notification; when set
+            (or HEYGEN_CALLBACK_URL is in the environment) the poll loop is
+            skipped entirely and HeyGen notifies the webhook on completion
 
     Returns:
-        Dict with status, video_path, and video_url
+        Dict with status, video_path, and video_url (or video_id if using webhook)
     """
+    # Validate before any network call - a missing file should fail in
+    # microseconds, not after an upload attempt
+    if not os.path.isfile(audio_path):
+        return {
+            "status": "error",
+            "message": f"audio not found: {audio_path}"
+        }
+
+    import requests  # for Timeout/RequestException; free once _get_session() ran
+
     try:
-        api_key = os.getenv("HEYGEN_API_KEY")
-        if not api_key:
+        if _AUTH_HEADERS is None:
             return {
                 "status": "error",
                 "message": "HEYGEN_API_KEY not set in environment"
             }
+        api_key = _API_KEY
+
+        logger.info(f"Generating avatar video with audio: {audio_path}")
 
-        print(f"Generating avatar video with audio: {audio_path}", file=sys.stderr)
+        # Fall back to a globally configured webhook endpoint
+        callback_url = callback_url or os.getenv("HEYGEN_CALLBACK_URL")
+
+        # Check the on-disk cache before re-running the whole HeyGen pipeline
+        cache_key = _video_cache_key(audio_path, avatar_id, background)
+        cached_video = os.path.join(CACHE_DIR, f"{cache_key}.mp4")
+        if os.path.isfile(cached_video):
+            # copyfile uses zero-copy kernel paths (sendfile/CopyFileEx),
+            # so a hit never pulls the video through userspace
+            shutil.copyfile(cached_video, output_path)
+            metadata = {}
+            try:
+                with open(os.path.join(CACHE_DIR, f"{cache_key}.json")) as f:
+                    metadata = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                pass
+            logger.info(f"✅ Cache hit, video copied to {output_path}")
+            return {
+                "status": "success",
+                "video_path": output_path,
+                "video_url": metadata.get("video_url"),
+                "video_id": metadata.get("video_id"),
+                "duration": metadata.get("duration", 0),
+                "cache": "hit"
+            }
 
         # Step 1: Upload audio file to HeyGen
-        print("Uploading audio file...", file=sys.stderr)
+        logger.info("Uploading audio file...")
         upload_url = "https://upload.heygen.com/v1/asset"
 
-        with open(audio_path, "rb") as audio_file:
-            file_data = audio_file.read()
-
         headers = {
             "X-Api-Key": api_key,
-            "Content-Type": "audio/mpeg"
+            "Content-Type": _audio_content_type(audio_path),
+            # Explicit length lets the server skip chunked transfer decoding
+            "Content-Length": str(os.path.getsize(audio_path))
         }
 
-        upload_response = requests.post(upload_url, headers=headers, data=file_data)
-        upload_response.raise_for_status()
-        upload_data = upload_response.json()
-
-            # Get the uploaded audio URL
-        audio_url = upload_data.get("data", {}).get("url")
+        # Pass the file handle so requests streams the body in chunks instead
+        # of holding a full copy of the audio in memory
+        with open(audio_path, "rb") as audio_file:
+            upload_response = _get_session().post(upload_url, headers=headers, data=audio_file)
+        if not (200 <= upload_response.status_code < 300):
+            return {
+                "status": "error",
+                "message": f"Failed to upload audio file: HTTP {upload_response.status_code}",
+                "details": upload_response.text
+            }
 
-        if not audio_url:
+        # Get the uploaded audio URL
+        try:
+            audio_url = _json_loads(upload_response.content)["data"]["url"]
+        except (ValueError, KeyError, TypeError):
             return {
                 "status": "error",
                 "message": "Failed to upload audio file",
-                "details": str(upload_data)
+                "details": upload_response.text
             }
 
-        print(f"Audio uploaded successfully: {audio_url}", file=sys.stderr)
+        logger.info(f"Audio uploaded successfully: {audio_url}")
 
         # Step 2: Create video with avatar
-        print("Creating avatar video...", file=sys.stderr)
+        logger.info("Creating avatar video...")
         create_url = "https://api.heygen.com/v2/video/generate"
 
-        headers = {
-            "X-Api-Key": api_key,
-            "Content-Type": "application/json"
-        }
+        headers = _JSON_HEADERS
 
         payload = {
+            **_BASE_PAYLOAD,
             "video_inputs": [{
                 "character": {
                     "type": "avatar",
@@ -354,16 +742,15 @@ def generate_avatar_video(
                     "type": "color",
                     "value": background
                 }
-            }],
-            "dimension": {
-                "width": DEFAULT_VIDEO_WIDTH,
-                "height": DEFAULT_VIDEO_HEIGHT
-            },
-            "aspect_ratio": DEFAULT_ASPECT_RATIO,
-            "test": False
+            }]
         }
 
-        create_response = requests.post(create_url, json=payload, headers=headers)
+        # Add callback URL if provided (for webhook-based completion)
+        if callback_url:
+            payload["callback_id"] = callback_url
+            logger.info(f"Using webhook callback: {callback_url}")
+
+        create_response = _get_session().post(create_url, data=_json_dumps(payload), headers=headers)
         create_response.raise_for_status()
         video_id = create_response.json().get("data", {}).get("video_id")
 
@@ -374,32 +761,55 @@ def generate_avatar_video(
                 "details": create_response.json()
             }
 
-        print(f"Video creation started. ID: {video_id}", file=sys.stderr)
+        logger.info(f"Video creation started. ID: {video_id}")
 
-        # Step 3: Poll for completion
-        status_url = f"https://api.heygen.com/v1/video_status.get?video_id={video_id}"
-        max_attempts = 240  # 20 minutes max wait (portrait videos can take longer)
-        attempt = 0
+        # If using webhook, return immediately without polling
+        if callback_url:
+            logger.info(f"✅ Video submitted with webhook. Will notify: {callback_url}")
+            return {
+                "status": "processing",
+                "video_id": video_id,
+                "message": "Video is processing. Will notify webhook when complete.",
+                "callback_url": callback_url
+            }
 
-        while attempt < max_attempts:
-            time.sleep(30)  # Check every 30 seconds
-            attempt += 1
+        # Step 3: Poll for completion with exponential backoff - fast jobs are
+        # detected within seconds, slow jobs back off to one call per 30s.
+        status_params = {"video_id": video_id}
+        timeout_seconds = 1200  # 20 minutes max wait (portrait videos can take longer)
+        deadline = time.monotonic() + timeout_seconds
+        delay = 2.0
+        last_status = None
+        etag = None  # conditional GET: a 304 reply is header-only
+
+        while time.monotonic() < deadline:
+            # Jitter avoids thundering-herd polling when many videos run in parallel
+            time.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(30.0, 1.5 * delay)
+            elapsed = timeout_seconds - (deadline - time.monotonic())
 
             try:
                 # Add timeout to prevent hanging forever
-                status_response = requests.get(status_url, headers=headers, timeout=30)
+                poll_headers = headers if etag is None else {**headers, "If-None-Match": etag}
+                status_response = _get_session().get(_STATUS_URL, params=status_params, headers=poll_headers, timeout=30)
+                if status_response.status_code == 304:
+                    continue  # Not Modified: status unchanged, keep polling
                 status_response.raise_for_status()
-                status_data = status_response.json().get("data", {})
+                etag = status_response.headers.get("ETag", etag)
+                status_data = _json_loads(status_response.content).get("data", {})
             except requests.Timeout:
-                print(f"⚠️  Status check timed out, retrying... ({attempt}/{max_attempts})", file=sys.stderr)
+                logger.info(f"⚠️  Status check timed out, retrying... ({elapsed:.0f}s/{timeout_seconds}s)")
                 continue  # Retry on timeout
             except requests.RequestException as e:
-                print(f"⚠️  Network error: {e}, retrying... ({attempt}/{max_attempts})", file=sys.stderr)
+                logger.info(f"⚠️  Network error: {e}, retrying... ({elapsed:.0f}s/{timeout_seconds}s)")
                 time.sleep(10)  # Wait longer before retry
                 continue
 
             video_status = status_data.get("status")
-            print(f"Status: {video_status} ({attempt}/{max_attempts})", file=sys.stderr)
+            # Only log transitions - the status repeats for dozens of polls
+            if video_status != last_status:
+                logger.info(f"Status: {video_status} ({elapsed:.0f}s/{timeout_seconds}s)")
+                last_status = video_status
 
             if video_status == "completed":
                 video_url = status_data.get("video_url")
@@ -410,15 +820,16 @@ def generate_avatar_video(
                         "message": "Video completed but no URL provided"
                     }
 
-                # Download the video
-                print(f"Downloading video to {output_path}...", file=sys.stderr)
-                video_response = requests.get(video_url, timeout=120)
-                video_response.raise_for_status()
+                logger.info(f"Downloading video to {output_path}...")
+                _download_video(video_url, output_path)
 
-                with open(output_path, "wb") as f:
-                    f.write(video_response.content)
+                logger.info(f"✅ Video saved to {output_path}")
 
-                print(f"✅ Video saved to {output_path}", file=sys.stderr)
+                _video_cache_store(cache_key, output_path, {
+                    "video_id": video_id,
+                    "video_url": video_url,
+                    "duration": status_data.get("duration", 0)
+                })
 
                 return {
                     "status": "success",
@@ -434,73 +845,631 @@ def generate_avatar_video(
                     "message": f"Video generation failed: {status_data.get('error', 'Unknown error')}"
                 }
 
-        # If we've exhausted attempts, video might still be processing
+        # If we've exhausted the deadline, video might still be processing
         # Return the video_id so user can check manually
         return {
             "status": "error",
-            "message": f"Video generation timed out after {max_attempts * 5 / 60:.1f} minutes. Video may still be processing.",
+            "message": f"Video generation timed out after {timeout_seconds / 60:.1f} minutes. Video may still be processing.",
             "video_id": video_id,
             "check_url": f"https://app.heygen.com/videos/{video_id}"
         }
 
     except Exception as e:
-        print(f"Error: {str(e)}")
+        logger.info(f"Error: {str(e)}")
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+
+
+# ---------------------------------------------------------------------------
+# Async variants (httpx with HTTP/2)
+#
+# requests is HTTP/1.1-only and synchronous, so the upload/create/poll/
+# download sequence cannot overlap and every concurrent job needs its own
+# connection. These variants multiplex all calls as HTTP/2 streams on one
+# TLS connection and let many avatar videos be driven from a single event
+# loop (e.g. asyncio.gather over a batch of scripts).
+# ---------------------------------------------------------------------------
+
+def _make_async_client():
+    """Create an HTTP/2-capable httpx client for the async pipeline."""
+    import httpx
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=32),
+        timeout=120
+    )
+
+
+# Shared client so every async call in the process multiplexes on the same
+# HTTP/2 connection pool. Rebuilt if the running event loop changes (e.g. a
+# library caller invokes asyncio.run more than once); the abandoned client
+# is aclose()d so its sockets don't leak.
+_ASYNC_CLIENT = None
+_ASYNC_CLIENT_LOOP = None
+
+
+async def _get_async_client():
+    """Return the process-wide async client for the current event loop."""
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT_LOOP is not loop:
+        if _ASYNC_CLIENT is not None:
+            try:
+                await _ASYNC_CLIENT.aclose()
+            except Exception:
+                pass  # best effort; the previous loop may already be gone
+        _ASYNC_CLIENT = _make_async_client()
+        _ASYNC_CLIENT_LOOP = loop
+    return _ASYNC_CLIENT
+
+
+async def _upload_background_image_async(client, api_key: str, background_image: str) -> Optional[str]:
+    """Async counterpart of _upload_background_image (cache-aware upload)."""
+    cached_url, bg_hash = _bg_asset_lookup(background_image)
+    if cached_url:
+        logger.info(f"✅ Reusing cached background asset: {cached_url}")
+        return cached_url
+
+    logger.info(f"Uploading background image: {background_image}")
+    image_url = await _upload_asset_async(client, api_key, background_image,
+                                          _image_content_type(background_image))
+    if image_url:
+        logger.info(f"✅ Background image uploaded successfully")
+        _bg_asset_store(background_image, bg_hash, image_url)
+    return image_url
+
+
+async def _upload_asset_async(client, api_key: str, path: str, content_type: str) -> Optional[str]:
+    """Upload a local file to HeyGen and return the asset URL (None on failure)."""
+    headers = {
+        "X-Api-Key": api_key,
+        "Content-Type": content_type,
+        "Content-Length": str(os.path.getsize(path))
+    }
+    with open(path, "rb") as f:
+        response = await client.post("https://upload.heygen.com/v1/asset",
+                                     headers=headers, content=f.read())
+    if not (200 <= response.status_code < 300):
+        logger.info(f"⚠️  Asset upload failed: HTTP {response.status_code}")
+        return None
+    try:
+        return _json_loads(response.content)["data"]["url"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+async def _poll_and_download_async(client, api_key: str, video_id: str,
+                                   output_path: str) -> Dict[str, Any]:
+    """
+    Poll video status with exponential backoff on asyncio.sleep (the loop is
+    free for other jobs between polls), then stream the finished MP4 to disk.
+    """
+    import asyncio
+
+    headers = {"X-Api-Key": api_key}
+    status_params = {"video_id": video_id}
+    timeout_seconds = 1200
+    deadline = time.monotonic() + timeout_seconds
+    delay = 2.0
+    last_status = None
+    etag = None  # conditional GET: a 304 reply is header-only
+
+    while time.monotonic() < deadline:
+        await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+        delay = min(30.0, 1.5 * delay)
+        elapsed = timeout_seconds - (deadline - time.monotonic())
+
+        poll_headers = headers if etag is None else {**headers, "If-None-Match": etag}
+        status_response = await client.get(_STATUS_URL, params=status_params, headers=poll_headers)
+        if status_response.status_code == 304:
+            continue  # Not Modified: status unchanged, keep polling
+        status_response.raise_for_status()
+        etag = status_response.headers.get("ETag", etag)
+        status_data = _json_loads(status_response.content).get("data", {})
+
+        video_status = status_data.get("status")
+        # Only log transitions - the status repeats for dozens of polls
+        if video_status != last_status:
+            logger.info(f"Status: {video_status} ({elapsed:.0f}s/{timeout_seconds}s)")
+            last_status = video_status
+
+        if video_status == "completed":
+            video_url = status_data.get("video_url")
+
+            if not video_url:
+                return {
+                    "status": "error",
+                    "message": "Video completed but no URL provided"
+                }
+
+            logger.info(f"Downloading video to {output_path}...")
+            async with client.stream("GET", video_url) as video_response:
+                video_response.raise_for_status()
+                length = int(video_response.headers.get("Content-Length", 0))
+                with open(output_path, "wb") as f:
+                    if length and hasattr(os, "posix_fallocate"):
+                        os.posix_fallocate(f.fileno(), 0, length)
+                    async for chunk in video_response.aiter_bytes(1 << 20):
+                        f.write(chunk)
+
+            logger.info(f"✅ Video saved to {output_path}")
+
+            return {
+                "status": "success",
+                "video_path": output_path,
+                "video_url": video_url,
+                "video_id": video_id,
+                "duration": status_data.get("duration", 0)
+            }
+
+        elif video_status == "failed":
+            return {
+                "status": "error",
+                "message": f"Video generation failed: {status_data.get('error', 'Unknown error')}"
+            }
+
+    return {
+        "status": "error",
+        "message": "Video generation timed out",
+        "video_id": video_id
+    }
+
+
+async def generate_avatar_video_from_text_async(
+    text: str,
+    output_path: str = "output.mp4",
+    avatar_id: str = DEFAULT_AVATAR_ID,
+    voice_id: str = DEFAULT_VOICE_ID,
+    background: str = DEFAULT_BACKGROUND,
+    background_image: Optional[str] = None,
+    speech_speed: float = DEFAULT_SPEECH_SPEED,
+    callback_url: Optional[str] = None,
+    client=None
+) -> Dict[str, Any]:
+    """
+    Async variant of generate_avatar_video_from_text.
+
+    Pass a shared httpx.AsyncClient to multiplex several videos over one
+    HTTP/2 connection; without one, a client is created for this call.
+
+    Returns:
+        Dict with status, video_path, video_url (or video_id if using webhook)
+    """
+    if client is None:
+        client = await _get_async_client()
+
+    try:
+        if _AUTH_HEADERS is None:
+            return {
+                "status": "error",
+                "message": "HEYGEN_API_KEY not set in environment"
+            }
+        api_key = _API_KEY
+
+        logger.info(f"Generating avatar video from text ({len(text)} chars)")
+
+        callback_url = callback_url or os.getenv("HEYGEN_CALLBACK_URL")
+
+        # Determine background configuration; a local-file upload runs as a
+        # task and is awaited only when the payload needs the asset URL
+        import asyncio
+
+        bg_task = None
+        bg_config = {
+            "type": "color",
+            "value": DEFAULT_BACKGROUND_COLOR
+        }
+        if background == "newsroom":
+            pass  # Default newsroom background (professional news studio)
+        elif background_image:
+            if os.path.isfile(background_image):
+                bg_task = asyncio.create_task(
+                    _upload_background_image_async(client, api_key, background_image)
+                )
+            else:
+                bg_config = {"type": "image", "url": background_image}
+        else:
+            bg_config = {"type": "color", "value": background}
+
+        logger.info("Creating avatar video with TTS...")
+
+        headers = _JSON_HEADERS
+
+        if bg_task is not None:
+            image_url = await bg_task
+            if image_url:
+                bg_config = {"type": "image", "url": image_url}
+            else:
+                logger.info(f"⚠️  Warning: Failed to upload background image, using default")
+
+        payload = {
+            **_BASE_PAYLOAD,
+            "caption": True,
+            "video_inputs": [{
+                "character": {
+                    "type": "avatar",
+                    "avatar_id": avatar_id,
+                    "avatar_style": "normal"
+                },
+                "voice": {
+                    "type": "text",
+                    "input_text": text,
+                    "voice_id": voice_id,
+                    "speed": speech_speed,
+                    "emotion": "Broadcaster",
+                    "elevanlabs_settings": {
+                        "model": "eleven_turbo_v2",
+                        "similarity_boost": 3.4,
+                        "stability": 3.4
+                    }
+                },
+                "background": bg_config
+            }]
+        }
+
+        if callback_url:
+            payload["callback_id"] = callback_url
+            logger.info(f"Using webhook callback: {callback_url}")
+
+        create_response = await client.post("https://api.heygen.com/v2/video/generate",
+                                            content=_json_dumps(payload), headers=headers)
+        create_response.raise_for_status()
+        video_id = create_response.json().get("data", {}).get("video_id")
+
+        if not video_id:
+            return {
+                "status": "error",
+                "message": "Failed to create video",
+                "details": create_response.json()
+            }
+
+        logger.info(f"Video creation started. ID: {video_id}")
+
+        if callback_url:
+            logger.info(f"✅ Video submitted with webhook. Will notify: {callback_url}")
+            return {
+                "status": "processing",
+                "video_id": video_id,
+                "message": "Video is processing. Will notify webhook when complete.",
+                "callback_url": callback_url
+            }
+
+        return await _poll_and_download_async(client, api_key, video_id, output_path)
+
+    except Exception as e:
+        logger.info(f"Error: {str(e)}")
         return {
             "status": "error",
             "message": str(e)
         }
 
 
+async def generate_avatar_video_async(
+    audio_path: str,
+    output_path: str = "output.mp4",
+    avatar_id: str = DEFAULT_AVATAR_ID,
+    background: str = "newsroom",
+    callback_url: Optional[str] = None,
+    client=None
+) -> Dict[str, Any]:
+    """
+    Async variant of generate_avatar_video (pre-recorded audio mode).
+
+    Returns:
+        Dict with status, video_path, and video_url (or video_id if using webhook)
+    """
+    if client is None:
+        client = await _get_async_client()
+
+    try:
+        if _AUTH_HEADERS is None:
+            return {
+                "status": "error",
+                "message": "HEYGEN_API_KEY not set in environment"
+            }
+        api_key = _API_KEY
+
+        logger.info(f"Generating avatar video with audio: {audio_path}")
+
+        callback_url = callback_url or os.getenv("HEYGEN_CALLBACK_URL")
+
+        logger.info("Uploading audio file...")
+        audio_url = await _upload_asset_async(client, api_key, audio_path,
+                                              _audio_content_type(audio_path))
+
+        if not audio_url:
+            return {
+                "status": "error",
+                "message": "Failed to upload audio file"
+            }
+
+        logger.info(f"Audio uploaded successfully: {audio_url}")
+
+        logger.info("Creating avatar video...")
+        headers = _JSON_HEADERS
+
+        payload = {
+            **_BASE_PAYLOAD,
+            "video_inputs": [{
+                "character": {
+                    "type": "avatar",
+                    "avatar_id": avatar_id,
+                    "avatar_style": "normal"
+                },
+                "voice": {
+                    "type": "audio",
+                    "audio_url": audio_url
+                },
+                "background": {
+                    "type": "color",
+                    "value": background
+                }
+            }]
+        }
+
+        if callback_url:
+            payload["callback_id"] = callback_url
+            logger.info(f"Using webhook callback: {callback_url}")
+
+        create_response = await client.post("https://api.heygen.com/v2/video/generate",
+                                            content=_json_dumps(payload), headers=headers)
+        create_response.raise_for_status()
+        video_id = create_response.json().get("data", {}).get("video_id")
+
+        if not video_id:
+            return {
+                "status": "error",
+                "message": "Failed to create video",
+                "details": create_response.json()
+            }
+
+        logger.info(f"Video creation started. ID: {video_id}")
+
+        if callback_url:
+            logger.info(f"✅ Video submitted with webhook. Will notify: {callback_url}")
+            return {
+                "status": "processing",
+                "video_id": video_id,
+                "message": "Video is processing. Will notify webhook when complete.",
+                "callback_url": callback_url
+            }
+
+        return await _poll_and_download_async(client, api_key, video_id, output_path)
+
+    except Exception as e:
+        logger.info(f"Error: {str(e)}")
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+
+
+async def _invalid_job() -> Dict[str, Any]:
+    return {
+        "status": "error",
+        "message": "No text or audio_path provided"
+    }
+
+
+def _job_coroutine(job: Dict[str, Any], client):
+    """Map one JSON job dict onto the matching async generator call."""
+    text = job.get("text", "")
+    if text:
+        return generate_avatar_video_from_text_async(
+            text=text,
+            output_path=job.get("output_path", "output.mp4"),
+            avatar_id=job.get("avatar_id", DEFAULT_AVATAR_ID),
+            voice_id=job.get("voice_id", DEFAULT_VOICE_ID),
+            background=job.get("background", "newsroom"),
+            background_image=job.get("background_image"),
+            callback_url=job.get("callback_url"),
+            client=client
+        )
+    if job.get("audio_path"):
+        return generate_avatar_video_async(
+            audio_path=job["audio_path"],
+            output_path=job.get("output_path", "output.mp4"),
+            avatar_id=job.get("avatar_id", DEFAULT_AVATAR_ID),
+            background=job.get("background", "newsroom"),
+            callback_url=job.get("callback_url"),
+            client=client
+        )
+    return _invalid_job()
+
+
+async def _run_jobs(jobs, emit=None) -> list:
+    """
+    Drive all jobs concurrently on one event loop and one HTTP/2 client.
+
+    All submissions go out first and poll together; when emit is given, each
+    result is passed to it the moment its job finishes (tagged with
+    job_index) instead of waiting for the whole batch.
+    """
+    import asyncio
+
+    # A fresh client per batch: each asyncio.run gets its own loop, so a
+    # cached client from a previous run would leak its open sockets
+    client = _make_async_client()
+
+    async def run_one(index, job):
+        result = await _job_coroutine(job, client)
+        result["job_index"] = index
+        if emit is not None:
+            emit(result)
+        return result
+
+    try:
+        return await asyncio.gather(*[run_one(i, job) for i, job in enumerate(jobs)])
+    finally:
+        await client.aclose()
+
+
+def generate_avatar_videos_batch(jobs, emit=None) -> list:
+    """
+    Sync entry point for a batch of jobs: N videos poll concurrently on a
+    single thread (and a single HTTP/2 connection) instead of N blocked
+    threads, so wall time approaches max(job) rather than sum(jobs).
+    """
+    import asyncio
+    return asyncio.run(_run_jobs(jobs, emit))
+
+
+def run_webhook_server(port: int = 0, timeout: float = 1200.0) -> Dict[str, Any]:
+    """
+    Bind a tiny HTTP server and wait for a single HeyGen completion POST.
+
+    Lets CLI users without their own webhook endpoint still use callback
+    delivery: submit with callback_url pointing here (via a tunnel if HeyGen
+    must reach through NAT), and one inbound POST replaces hundreds of
+    status polls. Port 0 picks an ephemeral port, announced on stderr.
+    """
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    received = {}
+    event = threading.Event()
+
+    class _CallbackHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length)
+            try:
+                received["payload"] = json.loads(body)
+            except json.JSONDecodeError:
+                received["payload"] = {"raw": body.decode(errors="replace")}
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"ok")
+            event.set()
+
+        def log_message(self, format, *args):
+            pass  # Keep stdout clean for the JSON result
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), _CallbackHandler)
+    logger.info(f"Webhook server listening on port {server.server_address[1]}")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        if event.wait(timeout):
+            return {"status": "success", "payload": received.get("payload")}
+        return {"status": "error", "message": "Timed out waiting for webhook callback"}
+    finally:
+        server.shutdown()
+
+
+def _handle_job(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Dispatch a single JSON job dict to the text or audio pipeline."""
+    text = input_data.get("text", "")
+    audio_path = input_data.get("audio_path", "")
+    output_path = input_data.get("output_path", "output.mp4")
+    avatar_id = input_data.get("avatar_id", DEFAULT_AVATAR_ID)
+    background = input_data.get("background", "newsroom")
+    background_image = input_data.get("background_image")
+    voice_id = input_data.get("voice_id", DEFAULT_VOICE_ID)
+    callback_url = input_data.get("callback_url")
+
+    # Text-to-speech mode (preferred)
+    if text:
+        return generate_avatar_video_from_text(
+            text=text,
+            output_path=output_path,
+            avatar_id=avatar_id,
+            voice_id=voice_id,
+            background=background,
+            background_image=background_image,
+            callback_url=callback_url
+        )
+    # Audio mode (legacy)
+    if audio_path:
+        return generate_avatar_video(
+            audio_path=audio_path,
+            output_path=output_path,
+            avatar_id=avatar_id,
+            background=background,
+            callback_url=callback_url
+        )
+    return {
+        "status": "error",
+        "message": "No text or audio_path provided"
+    }
+
+
+def run_daemon():
+    """
+    Long-running worker mode for the Go integration: one NDJSON job (or JSON
+    array of jobs) per stdin line, one NDJSON result per job on stdout.
+
+    Keeping a single process alive means each job costs a line read instead
+    of a fresh interpreter spawn plus module imports (~200-400ms), and every
+    job shares the pooled session, caches and warm TLS connections. A line
+    holding a JSON array runs as one concurrent batch on the event loop.
+    """
+    def emit(result):
+        sys.stdout.buffer.write(_json_dumps(result) + b"\n")
+        sys.stdout.buffer.flush()
+
+    for line in sys.stdin.buffer:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = _json_loads(line)
+        except ValueError as e:
+            emit({"status": "error", "message": f"Invalid JSON input: {str(e)}"})
+            continue
+        try:
+            if isinstance(job, list):
+                generate_avatar_videos_batch(job, emit)
+            else:
+                emit(_handle_job(job))
+        except Exception as e:
+            emit({"status": "error", "message": str(e)})
 
 
 def main():
     """
     CLI interface for avatar video generation using HeyGen.
-    Supports both text-to-speech and audio input modes.
+    Supports both text-to-speech and audio input modes; a JSON array of
+    jobs on stdin runs the whole batch concurrently.
     """
+    # Long-running worker: NDJSON jobs in, NDJSON results out
+    if "--daemon" in sys.argv:
+        run_daemon()
+        return
+
+    # Wait for a single completion webhook instead of polling
+    if "--webhook-server" in sys.argv:
+        idx = sys.argv.index("--webhook-server")
+        port = int(sys.argv[idx + 1]) if len(sys.argv) > idx + 1 and sys.argv[idx + 1].isdigit() else 0
+        print(json.dumps(run_webhook_server(port)))
+        return
+
     # Check for stdin JSON input (for Go integration)
     if not sys.stdin.isatty():
         try:
-            input_data = json.loads(sys.stdin.read())
-
-            # Determine if using text-to-speech or audio mode
-            text = input_data.get("text", "")
-            audio_path = input_data.get("audio_path", "")
-            output_path = input_data.get("output_path", "output.mp4")
-            avatar_id = input_data.get("avatar_id", DEFAULT_AVATAR_ID)
-            background = input_data.get("background", "newsroom")
-            background_image = input_data.get("background_image")
-            voice_id = input_data.get("voice_id", DEFAULT_VOICE_ID)
-
-            # Text-to-speech mode (preferred)
-            if text:
-
-                result = generate_avatar_video_from_text(
-                    text=text,
-                    output_path=output_path,
-                    avatar_id=avatar_id,
-                    voice_id=voice_id,
-                    background=background,
-                    background_image=background_image
-                )
-            # Audio mode (legacy)
-            elif audio_path:
-                result = generate_avatar_video(
-                    audio_path=audio_path,
-                    output_path=output_path,
-                    avatar_id=avatar_id,
-                    background=background
-                )
-            else:
-                print(json.dumps({
-                    "status": "error",
-                    "message": "No text or audio_path provided"
-                }))
+            # .buffer hands orjson raw bytes, skipping a redundant UTF-8 decode
+            input_data = _json_loads(sys.stdin.buffer.read())
+
+            # A list of jobs runs as one concurrent batch on the event loop,
+            # emitting one NDJSON result per job as it completes so the Go
+            # caller can stream instead of waiting for the slowest video
+            if isinstance(input_data, list):
+                def emit(result):
+                    sys.stdout.buffer.write(_json_dumps(result) + b"\n")
+                    sys.stdout.buffer.flush()
+
+                generate_avatar_videos_batch(input_data, emit)
                 return
 
-            print(json.dumps(result))
+            result = _handle_job(input_data)
+            sys.stdout.buffer.write(_json_dumps(result) + b"\n")
+            sys.stdout.buffer.flush()
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # orjson.JSONDecodeError and json.JSONDecodeError both subclass this
             print(json.dumps({
                 "status": "error",
                 "message": f"Invalid JSON input: {str(e)}"
@@ -541,6 +1510,11 @@ def main():
         print("\n🎵 AUDIO MODE (Legacy):")
         print("  CLI: python video_generation.py audio.mp3 output.mp4 [avatar_id]")
         print("  JSON: echo '{\"audio_path\":\"...\",\"output_path\":\"...\"}' | python video_generation.py")
+        print("\n🔁 DAEMON MODE (long-running worker):")
+        print("  python video_generation.py --daemon  # one NDJSON job per stdin line, one result per line")
+        print("\n🔔 WEBHOOK MODE (skip polling):")
+        print("  Pass \"callback_url\" in the JSON input (or set HEYGEN_CALLBACK_URL)")
+        print("  Local receiver: python video_generation.py --webhook-server [port]")
         print("\n📚 Resources:")
         print("  Avatars: https://app.heygen.com/avatars")
         print("  Voices: https://app.heygen.com/voice-library")